@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.contrib.postgres.aggregates import StringAgg
 
 from .models import Movies, People, Genres, MoviePeople, MovieGenres
 
@@ -50,11 +51,11 @@ class MoviesAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         queryset = super(MoviesAdmin, self).get_queryset(request)
-        queryset = queryset.prefetch_related('movie_genres')
+        queryset = queryset.annotate(
+            genre_list=StringAgg('movie_genres__genre_name',
+                                 delimiter=', ', distinct=True)
+        )
         return queryset
 
     def genres(self, instance):
-        result = ", ".join([
-            genre.genre_name for genre in instance.movie_genres.all()
-        ])
-        return result
+        return instance.genre_list
@@ -1,7 +1,8 @@
+from django.utils.functional import cached_property
 from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
 
-from movies.models import Movies, Genres
+from movies.models import Movies, Genres, MoviePeople
 
 
 class GenresSerializer(serializers.RelatedField):
@@ -13,12 +14,55 @@ class GenresSerializer(serializers.RelatedField):
         ordering = ['-id']
 
 
-class PeopleSerializer(serializers.RelatedField):
-    def to_representation(self, value):
-        return value.person.full_name
+class MoviesSerializer(ModelSerializer):
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
 
+    @cached_property
+    def _readable_fields(self):
+        """Build the readable field list once per (list) serializer.
+
+        With many=True the same child instance serializes every row of
+        the page, so caching here drops the per-row fields walk that
+        dominates DRF list responses.
+        """
+        return [field for field in self.fields.values()
+                if not field.write_only]
+
+    @cached_property
+    def _fast_fields(self):
+        """Precompute (key, resolver) pairs for to_representation.
+
+        Every source here is a single attribute lookup, so the generic
+        Field.get_attribute machinery (dotted paths, BoundField, except
+        chains) is pure overhead on the hot path.
+        """
+        pairs = []
+        for field in self._readable_fields:
+            if isinstance(field, serializers.SerializerMethodField):
+                pairs.append((field.field_name,
+                              getattr(self, field.method_name)))
+            elif isinstance(field, serializers.ManyRelatedField):
+                pairs.append((
+                    field.field_name,
+                    lambda obj, field=field:
+                    field.to_representation(
+                        getattr(obj, field.source).all())))
+            else:
+                pairs.append((
+                    field.field_name,
+                    lambda obj, field=field:
+                    None if (value := getattr(obj, field.source)) is None
+                    else field.to_representation(value)))
+        return pairs
+
+    def to_representation(self, instance):
+        return {key: resolve(instance) for key, resolve in self._fast_fields}
 
-class MoviesSerializer(ModelSerializer):
     id = serializers.UUIDField(source='movie_id')
     title = serializers.CharField(source='movie_title')
     description = serializers.CharField(source='movie_desc')
@@ -28,12 +72,23 @@ class MoviesSerializer(ModelSerializer):
     rating = serializers.FloatField(source='movie_rating')
     genres = GenresSerializer(source='movie_genres',
                               read_only=True, many=True)
-    actors = PeopleSerializer(source='actors_field',
-                              many=True, read_only=True)
-    directors = PeopleSerializer(source='directors_field',
-                                 many=True, read_only=True)
-    writers = PeopleSerializer(source='writers_field',
-                               many=True, read_only=True)
+    actors = serializers.SerializerMethodField()
+    directors = serializers.SerializerMethodField()
+    writers = serializers.SerializerMethodField()
+
+    def _people_names(self, obj, role):
+        return [movie_person.person.full_name
+                for movie_person in obj.people_all
+                if movie_person.person_role == role]
+
+    def get_actors(self, obj):
+        return self._people_names(obj, MoviePeople.PersonRole.ACTOR)
+
+    def get_directors(self, obj):
+        return self._people_names(obj, MoviePeople.PersonRole.DIRECTOR)
+
+    def get_writers(self, obj):
+        return self._people_names(obj, MoviePeople.PersonRole.WRITER)
 
     class Meta:
         model = Movies
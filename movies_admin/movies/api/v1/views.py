@@ -1,13 +1,55 @@
-from django.db.models import Prefetch
+from math import ceil
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Max, Prefetch
+from django.http import HttpResponseNotModified
+from django.utils.functional import cached_property
+from django.utils.http import http_date, parse_http_date_safe
 from rest_framework import pagination
 from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
-from movies.models import Movies, MoviePeople, People
+from movies.models import Movies, MoviePeople
 from movies.api.v1.serializers import MoviesSerializer
 
+COUNT_CACHE_KEY = 'movies_api_count'
+COUNT_CACHE_TIMEOUT = 60
+
+
+def get_movies_count() -> int:
+    """Movies row count estimated from pg stats and cached for a minute.
+
+    SELECT COUNT(*) scales with table size and is unrelated to the page
+    being returned, so the planner estimate is good enough here. Exact
+    count is used only when the table was never analyzed.
+    """
+    count = cache.get(COUNT_CACHE_KEY)
+    if count is None:
+        with connection.cursor() as curs:
+            curs.execute("""SELECT reltuples::bigint
+                              FROM pg_class
+                             WHERE oid = 'content.movies'::regclass;""")
+            count = curs.fetchone()[0]
+        if count < 0:
+            count = Movies.objects.count()
+        cache.set(COUNT_CACHE_KEY, count, timeout=COUNT_CACHE_TIMEOUT)
+    return count
+
+
+class CachedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        if getattr(self.object_list, 'query', None) is not None \
+                and self.object_list.query.where:
+            return super().count
+        return get_movies_count()
+
 
 class CustomPagination(pagination.PageNumberPagination):
+    django_paginator_class = CachedCountPaginator
+
     def get_paginated_response(self, data):
         return Response({
             'count': self.page.paginator.count,
@@ -24,17 +66,94 @@ class MoviesViewSet(ReadOnlyModelViewSet):
     queryset = Movies.objects.prefetch_related(
         Prefetch('movie_genres'),
         Prefetch('people_related', queryset=MoviePeople.objects
-                 .filter(person_role='actor').distinct('movie_id')
-                 .select_related('person'),
-                 to_attr='actors_field'),
-        Prefetch('people_related', queryset=MoviePeople.objects
-                 .filter(person_role='writer').distinct('movie_id')
                  .select_related('person'),
-                 to_attr='writers_field'),
-        Prefetch('people_related', queryset=MoviePeople.objects
-                 .filter(person_role='director').distinct('movie_id')
-                 .select_related('person'),
-                 to_attr='directors_field'),
+                 to_attr='people_all'),
     )
     serializer_class = MoviesSerializer
     pagination_class = CustomPagination
+
+    PEOPLE_FIELDS = ('actors', 'directors', 'writers')
+
+    def get_requested_fields(self):
+        """Parse ?fields=id,title,... into a list, or None for all."""
+        fields = self.request.query_params.get('fields')
+        if not fields:
+            return None
+        return [field for field in fields.split(',') if field] or None
+
+    def get_queryset(self):
+        """Prefetch genres and people only when those fields are asked."""
+        fields = self.get_requested_fields()
+        queryset = Movies.objects.all()
+        if fields is None or 'genres' in fields:
+            queryset = queryset.prefetch_related(Prefetch('movie_genres'))
+        if fields is None or any(field in fields
+                                 for field in self.PEOPLE_FIELDS):
+            queryset = queryset.prefetch_related(
+                Prefetch('people_related', queryset=MoviePeople.objects
+                         .select_related('person'),
+                         to_attr='people_all'),
+            )
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields is not None:
+            kwargs['fields'] = fields
+        return super().get_serializer(*args, **kwargs)
+
+    def get_last_modified(self):
+        """Newest movies.updated_at — one index-only aggregate."""
+        return Movies.objects.aggregate(
+            last_modified=Max('updated_at'))['last_modified']
+
+    def list(self, request, *args, **kwargs):
+        """Return a page of movies serialized by Postgres itself.
+
+        Rows come from Movies.objects.as_json_page() as ready dicts,
+        so the DRF serializer is bypassed entirely on the hot path.
+        Conditional requests are answered with 304 before any page
+        query runs: not doing the work at all is the cheapest path.
+        """
+        last_modified = self.get_last_modified()
+        count = get_movies_count()
+        timestamp = last_modified.timestamp() if last_modified else 0
+        etag = 'W/"{}-{}"'.format(timestamp, count)
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if_modified_since = parse_http_date_safe(
+            request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+        # HTTP dates carry whole seconds only, while updated_at keeps
+        # Postgres microseconds — compare at second granularity or the
+        # check never matches.
+        if if_none_match == etag or (
+                if_none_match is None and if_modified_since is not None
+                and int(timestamp) <= if_modified_since):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            if last_modified:
+                response['Last-Modified'] = http_date(timestamp)
+            return response
+        page_size = self.paginator.get_page_size(request)
+        try:
+            page_number = int(request.query_params.get('page', 1))
+        except ValueError:
+            page_number = 1
+        total_pages = max(ceil(count / page_size), 1)
+        page_number = min(max(page_number, 1), total_pages)
+        result = Movies.objects.as_json_page(
+            offset=(page_number - 1) * page_size, limit=page_size)
+        fields = self.get_requested_fields()
+        if fields is not None:
+            result = [{field: row[field] for field in fields if field in row}
+                      for row in result]
+        response = Response({
+            'count': count,
+            'total_pages': total_pages,
+            'prev': page_number - 1 if page_number > 1 else None,
+            'next': page_number + 1 if page_number < total_pages else None,
+            'result': result,
+        })
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(timestamp)
+        return response
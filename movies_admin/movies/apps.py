@@ -3,7 +3,4 @@ from django.apps import AppConfig
 
 class MoviesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'movies'
-
-    def ready(self):
-        import movies.signals
\ No newline at end of file
+    name = 'movies'
\ No newline at end of file
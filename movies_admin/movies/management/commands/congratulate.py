@@ -0,0 +1,19 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+
+from movies.models import People
+
+
+class Command(BaseCommand):
+    help = 'Greet people whose birthday is today. Meant for a daily cron job.'
+
+    def handle(self, *args, **options):
+        today = datetime.date.today()
+        birthday_people = People.objects.filter(
+            birthday__month=today.month, birthday__day=today.day
+        )
+        for person in birthday_people:
+            self.stdout.write(
+                f'У {person.full_name} сегодня день рождения! 🥳'
+            )
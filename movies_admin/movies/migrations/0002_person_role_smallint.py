@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='moviepeople',
+            name='person_role',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'actor'), (2, 'director'), (3, 'writer')]),
+        ),
+        migrations.AddIndex(
+            model_name='moviepeople',
+            index=models.Index(condition=models.Q(person_role=1), fields=['movie'], name='movie_people_actor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moviepeople',
+            index=models.Index(condition=models.Q(person_role=2), fields=['movie'], name='movie_people_director_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moviepeople',
+            index=models.Index(condition=models.Q(person_role=3), fields=['movie'], name='movie_people_writer_idx'),
+        ),
+    ]
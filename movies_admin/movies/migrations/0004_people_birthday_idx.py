@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0003_movie_rating_float'),
+    ]
+
+    operations = [
+        # Functional index expressions land in Django 4.0, so raw SQL it is.
+        migrations.RunSQL(
+            sql="""CREATE INDEX people_birthday_month_day_idx
+                       ON content.people ((EXTRACT(month FROM birthday)),
+                                          (EXTRACT(day FROM birthday)));""",
+            reverse_sql="""DROP INDEX content.people_birthday_month_day_idx;""",
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0004_people_birthday_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movies',
+            index=models.Index(fields=['updated_at', 'movie_id'], name='movies_updated_at_id_idx'),
+        ),
+    ]
@@ -1,7 +1,7 @@
 import uuid
 
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db import models
+from django.db import connection, models
 from django.utils.translation import gettext_lazy as _
 
 
@@ -56,6 +56,48 @@ class People(TimeStampedModel, models.Model):
         return self.full_name
 
 
+class MoviesManager(models.Manager):
+    def as_json_page(self, offset: int, limit: int) -> list:
+        """Build one page of API-ready movie dicts with a single query.
+
+        Aggregation of genres and people is done by Postgres with
+        ARRAY_AGG/JSON_AGG, so rows come back as ready dicts and skip
+        the per-field serializer machinery.
+        """
+        with connection.cursor() as curs:
+            curs.execute("""
+SELECT m.movie_id::text AS id,
+       m.movie_title AS title,
+       m.movie_desc AS description,
+       TO_CHAR(m.created_at, 'YYYY-MM-DD') AS creation_date,
+       m.movie_rating AS rating,
+       m.movie_type::text AS type,
+       COALESCE(ARRAY_AGG(DISTINCT g.genre_name)
+           FILTER (WHERE g.genre_name IS NOT NULL),
+           '{}'::text[]) AS genres,
+       COALESCE(JSON_AGG(DISTINCT p.full_name)
+           FILTER (WHERE mp.person_role = 1), '[]'::json) AS actors,
+       COALESCE(JSON_AGG(DISTINCT p.full_name)
+           FILTER (WHERE mp.person_role = 2), '[]'::json) AS directors,
+       COALESCE(JSON_AGG(DISTINCT p.full_name)
+           FILTER (WHERE mp.person_role = 3), '[]'::json) AS writers
+  FROM content.movies AS m
+  LEFT JOIN content.movie_genres AS mg
+            ON m.movie_id = mg.movie_id
+  LEFT JOIN content.genres AS g
+            ON mg.genre_id = g.genre_id
+  LEFT JOIN content.movie_people AS mp
+            ON m.movie_id = mp.movie_id
+  LEFT JOIN content.people AS p
+            ON mp.person_id = p.person_id
+ GROUP BY m.movie_id, m.movie_title, m.movie_desc, m.movie_rating
+ ORDER BY m.movie_title
+ LIMIT %s OFFSET %s;
+""", (limit, offset))
+            columns = [column.name for column in curs.description]
+            return [dict(zip(columns, row)) for row in curs.fetchall()]
+
+
 class Movies(TimeStampedModel, models.Model):
     class MovieType(models.TextChoices):
         MOVIE = 'movie', _('movie')
@@ -69,8 +111,8 @@ class Movies(TimeStampedModel, models.Model):
     movie_desc = models.TextField(_('movie desc'), blank=True, null=True)
     movie_type = models.CharField(_('movie type'), max_length=10,
                                   choices=MovieType.choices)
-    movie_rating = models.DecimalField(
-        _('rating'), max_digits=2, decimal_places=1,
+    movie_rating = models.FloatField(
+        _('rating'),
         validators=[MinValueValidator(0), MaxValueValidator(10)],
         blank=True, null=True
     )
@@ -85,21 +127,29 @@ class Movies(TimeStampedModel, models.Model):
         through_fields=('movie', 'person')
     )
 
+    objects = MoviesManager()
+
     class Meta:
         verbose_name = _('movie')
         verbose_name_plural = _('movies')
         db_table = 'content"."movies'
         ordering = ['movie_title']
+        indexes = [
+            # Covering index for ETL delta scans: the extractor filters
+            # on updated_at and only reads movie_id back.
+            models.Index(fields=['updated_at', 'movie_id'],
+                         name='movies_updated_at_id_idx'),
+        ]
 
     def __str__(self):
         return self.movie_title
 
 
 class MoviePeople(models.Model):
-    class PersonRole(models.TextChoices):
-        ACTOR = 'actor', _('actor')
-        DIRECTOR = 'director', _('director')
-        WRITER = 'writer', _('writer')
+    class PersonRole(models.IntegerChoices):
+        ACTOR = 1, _('actor')
+        DIRECTOR = 2, _('director')
+        WRITER = 3, _('writer')
 
     movie_people_id = models.UUIDField(
         _('movie people uuid'), primary_key=True, default=uuid.uuid4,
@@ -107,12 +157,24 @@ class MoviePeople(models.Model):
     )
     movie = models.ForeignKey(Movies, related_name='people_related', on_delete=models.CASCADE)
     person = models.ForeignKey(People, on_delete=models.CASCADE)
-    person_role = models.CharField(max_length=10, choices=PersonRole.choices)
+    person_role = models.PositiveSmallIntegerField(
+        choices=PersonRole.choices)
 
     class Meta:
         verbose_name = _('movie person')
         verbose_name_plural = _('movie people')
         db_table = 'content"."movie_people'
+        indexes = [
+            models.Index(fields=['movie'],
+                         condition=models.Q(person_role=1),
+                         name='movie_people_actor_idx'),
+            models.Index(fields=['movie'],
+                         condition=models.Q(person_role=2),
+                         name='movie_people_director_idx'),
+            models.Index(fields=['movie'],
+                         condition=models.Q(person_role=3),
+                         name='movie_people_writer_idx'),
+        ]
 
     def __str__(self):
         return f'{self.movie} ({self.person}, {self.person_role})'
@@ -11,16 +11,16 @@ def backoff(ExceptionToCheck, logger: logging.Logger,
 
         @wraps(f)
         def f_retry(*args, **kwargs):
-            mtries, mdelay = tries, delay
-            while mtries > 1:
+            mdelay = delay
+            for attempt in range(tries):
                 try:
                     return f(*args, **kwargs)
                 except ExceptionToCheck as e:
-                    logger.warning("%s, Retrying in %d seconds...", e, mdelay)
+                    if attempt == tries - 1:
+                        raise
+                    logger.warning("%s, Retrying in %s seconds...", e, mdelay)
                     time.sleep(mdelay)
-                    mtries -= 1
                     mdelay *= backoff
-            return f(*args, **kwargs)
 
         return f_retry
 
@@ -40,4 +40,20 @@ language plpgsql;
 CREATE TRIGGER people_updated
     AFTER UPDATE OF full_name ON content.people
     FOR EACH ROW
-    EXECUTE PROCEDURE function_people_updated();
\ No newline at end of file
+    EXECUTE PROCEDURE function_people_updated();
+-- Wake the ETL with a notification instead of making it poll. The
+-- genre/people triggers above funnel their changes into UPDATEs of
+-- content.movies, so a statement-level trigger there covers everything.
+CREATE OR REPLACE FUNCTION function_etl_notify() RETURNS TRIGGER AS
+$BODY$
+BEGIN
+    PERFORM pg_notify('etl_dirty', '');
+    RETURN NULL;
+END;
+$BODY$
+language plpgsql;
+
+CREATE TRIGGER movies_etl_notify
+    AFTER INSERT OR UPDATE ON content.movies
+    FOR EACH STATEMENT
+    EXECUTE PROCEDURE function_etl_notify();
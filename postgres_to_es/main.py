@@ -1,12 +1,18 @@
+import gzip
+import logging
 import signal
-import json
+import queue
+import select
 import sys
+import threading
 import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 import requests
 
 import psycopg2
-from psycopg2.extras import DictCursor
+from psycopg2.pool import ThreadedConnectionPool
 
 from state import State, JsonFileStorage
 from settings import Config
@@ -15,6 +21,53 @@ from back_off import backoff
 
 logger = get_logger()
 
+# Keyset position meaning "from the very beginning".
+EPOCH_WATERMARK = ('1970-01-01', '00000000-0000-0000-0000-000000000000')
+
+# Streamed through a named cursor, which cannot wrap EXECUTE of a
+# prepared statement, so this stays an ordinary parameterized query.
+# The whole ES document is assembled server-side and returned as ready
+# JSON text, so the transformer never rebuilds it field by field.
+EXTRACT_MOVIES_SQL = """
+SELECT m.movie_id,
+       JSONB_BUILD_OBJECT(
+           'imdb_rating', m.movie_rating,
+           'genre', ARRAY_AGG(DISTINCT g.genre_name),
+           'title', m.movie_title,
+           'description', m.movie_desc,
+           'director', ARRAY_AGG(DISTINCT p.full_name)
+               FILTER (WHERE mp.person_role = 2),
+           'actors_names', ARRAY_AGG(DISTINCT p.full_name)
+               FILTER (WHERE mp.person_role = 1),
+           'writers_names', ARRAY_AGG(DISTINCT p.full_name)
+               FILTER (WHERE mp.person_role = 3),
+           'actors', JSONB_AGG(DISTINCT jsonb_build_object(
+                   'id', p.person_id, 'name', p.full_name))
+               FILTER (WHERE mp.person_role = 1),
+           'writers', JSONB_AGG(DISTINCT jsonb_build_object(
+                   'id', p.person_id, 'name', p.full_name))
+               FILTER (WHERE mp.person_role = 3)
+       )::text AS doc,
+       m.updated_at
+  FROM (SELECT movie_id
+          FROM content.movies
+         WHERE (updated_at, movie_id) > (%s, %s)
+         ORDER BY updated_at, movie_id
+         LIMIT %s) AS batch
+  JOIN content.movies AS m
+            ON m.movie_id = batch.movie_id
+  LEFT JOIN content.movie_genres AS mg
+            ON m.movie_id = mg.movie_id
+  LEFT JOIN content.genres AS g
+            ON mg.genre_id = g.genre_id
+  LEFT JOIN content.movie_people AS mp
+            ON m.movie_id = mp.movie_id
+  LEFT JOIN content.people AS p
+            ON mp.person_id = p.person_id
+ GROUP BY m.movie_id, m.movie_title, m.movie_desc, m.movie_rating
+ ORDER BY m.updated_at, m.movie_id;
+"""
+
 
 class PgExtractor:
     """Connects and extracts data from Postgres in generator form."""
@@ -22,6 +75,9 @@ class PgExtractor:
     def __init__(self, state: State, config: Config):
         self.state = state
         self.connection = None
+        self.probe_cursor = None
+        self.listen_connection = None
+        self.pool = None
         self.config = config
         self.dsl = {'dbname': config.movies_pg.dsn.dbname,
                     'user': config.movies_pg.dsn.user,
@@ -29,129 +85,169 @@ class PgExtractor:
                     'host': config.movies_pg.dsn.host,
                     'port': config.movies_pg.dsn.port,
                     }
-        self.chunk_size = config.movies_pg.chunk_size
+        self.id_chunk_size = config.movies_pg.id_chunk_size
+        self.row_chunk_size = config.movies_pg.row_chunk_size
+        self.pool_size = config.movies_pg.pool_size
 
     def is_connected(self) -> bool:
         return bool(self.connection and self.connection.closed == 0)
 
     @backoff(Exception, logger=logger)
     def connect(self):
+        if self.is_connected() and self.validate():
+            return
         try:
-            pg_conn = psycopg2.connect(**self.dsl, cursor_factory=DictCursor)
-            self.connection = pg_conn
+            if self.pool is None or self.pool.closed:
+                # Default tuple cursor: rows are unpacked positionally,
+                # so DictRow would only add a per-row wrapper.
+                self.pool = ThreadedConnectionPool(
+                    minconn=1, maxconn=self.pool_size, **self.dsl)
+            self.connection = self.pool.getconn()
+            # One unnamed cursor reused for every liveness probe; named
+            # extract cursors stay per-transaction since a DECLAREd
+            # portal cannot be re-executed.
+            self.probe_cursor = self.connection.cursor()
         except Exception:
             self.connection = None
+            self.probe_cursor = None
             raise
 
+    def validate(self) -> bool:
+        """Cheap liveness probe for the checked-out connection."""
+        try:
+            if self.probe_cursor is None or self.probe_cursor.closed:
+                self.probe_cursor = self.connection.cursor()
+            self.probe_cursor.execute("""SELECT 1;""")
+            return True
+        except Exception as e:
+            logger.debug('Error %s', e)
+            try:
+                self.pool.putconn(self.connection, close=True)
+            except Exception:
+                pass
+            self.connection = None
+            self.probe_cursor = None
+            return False
+
+    def release(self):
+        """End the read transaction but keep the connection checked out."""
+        try:
+            self.connection.rollback()
+        except Exception as e:
+            logger.debug('Error %s', e)
+
     def disconnect(self):
         try:
-            self.connection.close()
+            if self.probe_cursor is not None and not self.probe_cursor.closed:
+                self.probe_cursor.close()
+            self.pool.putconn(self.connection)
         except Exception as e:
-            logger.debug(f'Error {e}')
+            logger.debug('Error %s', e)
         finally:
             self.connection = None
-
-    def get_updated_time(self) -> str:
-        updated_time = self.state.get_state('movies_updated_at')
-        if not updated_time:
-            self.state.set_state('movies_updated_at', '1970-01-01')
-            updated_time = self.state.get_state('movies_updated_at')
-        return updated_time
+            self.probe_cursor = None
 
     @backoff(Exception, logger=logger)
-    def check_updated_movies(self) -> bool:
-        logger.info('Checking movie updates...')
-        curs = self.connection.cursor()
-        updated_time = self.get_updated_time()
-        curs.execute("""SELECT movie_id, updated_at
-                          FROM content.movies
-                         WHERE updated_at > %s
-                         LIMIT 1;""", (updated_time,))
-        if any_updates := curs.fetchone():
-            logger.info('Some movies updated')
-            curs.close()
+    def listen(self):
+        """Subscribe to etl_dirty notifications on a dedicated connection."""
+        if self.listen_connection and self.listen_connection.closed == 0:
+            return
+        self.listen_connection = psycopg2.connect(**self.dsl)
+        self.listen_connection.autocommit = True
+        with self.listen_connection.cursor() as curs:
+            curs.execute("""LISTEN etl_dirty;""")
+
+    def wait_for_updates(self, timeout: float) -> bool:
+        """Block until Postgres notifies about changes or timeout passes.
+
+        Returns True when woken by a notification; the timeout acts as
+        a keepalive so missed notifications only delay, never lose,
+        updates.
+        """
+        try:
+            if select.select([self.listen_connection],
+                             [], [], timeout) == ([], [], []):
+                return False
+            self.listen_connection.poll()
+            self.listen_connection.notifies.clear()
+            return True
+        except Exception as e:
+            logger.debug('Error %s', e)
+            self.listen_connection = None
             return True
-        else:
-            logger.info('No movies updated')
-            curs.close()
-            return False
 
-    @backoff(Exception, logger=logger)
+    def get_watermark(self) -> tuple:
+        """Return the (updated_at, movie_id) keyset position."""
+        updated_time = self.state.get_state('movies_updated_at')
+        last_id = self.state.get_state('movies_last_id')
+        if not updated_time:
+            updated_time, last_id = EPOCH_WATERMARK
+            self.state.set_state('movies_updated_at', updated_time)
+            self.state.set_state('movies_last_id', last_id)
+        return updated_time, last_id or EPOCH_WATERMARK[1]
+
     def extract_updated_movies(self):
-        curs = self.connection.cursor()
-        updated_time = self.get_updated_time()
-        curs.execute("""
-SELECT m.movie_id,
-       m.movie_rating as imdb_rating,
-       ARRAY_AGG(DISTINCT g.genre_name) AS genre,
-       m.movie_title,
-       m.movie_desc,
-       ARRAY_AGG(DISTINCT p.full_name)
-           FILTER (WHERE mp.person_role = 'director') AS director,
-       ARRAY_AGG(DISTINCT p.full_name)
-           FILTER (WHERE mp.person_role = 'actor') AS actors_names,  
-       ARRAY_AGG(DISTINCT p.full_name)
-           FILTER (WHERE mp.person_role = 'writer') AS writers_names,                                                        
-       JSON_AGG(DISTINCT jsonb_build_object('id', p.person_id,
-                                            'name', p.full_name))
-           FILTER (WHERE mp.person_role = 'actor') AS actors,
-       JSON_AGG(DISTINCT jsonb_build_object('id', p.person_id,
-                                            'name', p.full_name))
-           FILTER (WHERE mp.person_role = 'writer') AS writers,
-       m.updated_at
-  FROM content.movies AS m
-  LEFT JOIN content.movie_genres AS mg
-            ON m.movie_id = mg.movie_id
-  LEFT JOIN content.genres AS g
-            ON mg.genre_id = g.genre_id
-  LEFT JOIN content.movie_people AS mp
-            ON m.movie_id = mp.movie_id
-  LEFT JOIN content.people AS p
-            ON mp.person_id = p.person_id
- WHERE m.updated_at > %s
- GROUP BY m.movie_id, m.movie_title, m.movie_desc, m.movie_rating;
-""", (updated_time,))
-        while title_list := curs.fetchmany(self.chunk_size):
-            yield title_list
-        curs.close()
+        # No @backoff here: on a generator it would only retry creating
+        # the generator object, never the iteration that actually talks
+        # to Postgres. Failures surface to EtlManager, which reconnects
+        # on the next poll cycle and resumes from the saved state.
+        # Named cursor keeps the result set on the server, so only
+        # chunk_size rows are held in memory at a time. The name must be
+        # unique per extractor in case several run on one backend.
+        # Each pass aggregates only the next id_chunk_size movies past
+        # the keyset watermark, which the transformer advances row by
+        # row, so planner cost is bounded by batch size, not table size.
+        while True:
+            curs = self.connection.cursor(name=f'movies_{id(self)}')
+            curs.itersize = self.row_chunk_size
+            curs.withhold = False
+            updated_time, last_id = self.get_watermark()
+            got_rows = False
+            try:
+                curs.execute(EXTRACT_MOVIES_SQL,
+                             (updated_time, last_id, self.id_chunk_size))
+                while title_list := curs.fetchmany(self.row_chunk_size):
+                    got_rows = True
+                    yield title_list
+            finally:
+                # Release the server-side portal even if the consumer
+                # bails.
+                curs.close()
+            if not got_rows:
+                break
 
 
 class DataTransformer:
     """Tranforms data from PgExtractor into JSON optimized data string."""
 
+    # Ids are UUIDs, so no JSON escaping needed: format them straight
+    # into a bytes template instead of serializing a dict per row.
+    ACTION_TMPL = b'{"index":{"_index":"movies","_id":"%s"}}'
+
     def __init__(self, extractor: PgExtractor):
         self.extractor = extractor
 
     def transform_movies(self):
+        action_tmpl = self.ACTION_TMPL
         for movie_list in (
                 movies := self.extractor.extract_updated_movies()):
-            result = []
-            for movie in movie_list:
-                movie_dict = dict(zip(['_id',
-                                       'imdb_rating',
-                                       'genre',
-                                       'title',
-                                       'description',
-                                       'director',
-                                       'actors_names',
-                                       'writers_names',
-                                       'actors',
-                                       'writers',
-                                       'updated_at'
-                                       ], movie))
-                result.append(
-                    {"index": {"_index": "movies", "_id": movie_dict['_id']}})
-                del movie_dict['_id']
-                self.extractor.state.set_state('movies_updated_at',
-                                               str(movie_dict['updated_at']))
-                del movie_dict['updated_at']
-                if movie_dict['imdb_rating']:
-                    movie_dict['imdb_rating'] = float(
-                        movie_dict['imdb_rating'])
-                result.append(movie_dict)
-            payload = '\n'.join([json.dumps(line) for line in result]) + '\n'
-            logger.debug(f'{payload[:120]}...')
-            yield payload
+            lines = []
+            for movie_id, doc, updated_at in movie_list:
+                lines.append(action_tmpl % str(movie_id).encode('ascii'))
+                lines.append(doc.encode())
+            # Rows arrive ordered by (updated_at, movie_id), so the last
+            # row of the chunk is the whole chunk's watermark. Only the
+            # in-memory position advances here, so extraction can keep
+            # streaming; the uploader persists the watermark once ES
+            # acknowledges the chunk.
+            last_id, _, last_updated = movie_list[-1]
+            self.extractor.state.set_state('movies_updated_at',
+                                           str(last_updated))
+            self.extractor.state.set_state('movies_last_id', str(last_id))
+            payload = b'\n'.join(lines) + b'\n'
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('%s...', payload[:120])
+            yield payload, (str(last_updated), str(last_id))
 
 
 class EsUploader:
@@ -159,48 +255,180 @@ class EsUploader:
 
     def __init__(self, config: Config):
         self.config = config
+        # One keep-alive session for everything sent to ES: connection
+        # setup is pure latency when every request goes to the same host.
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=2 * config.movies_es.thread_count)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.alive_url = '{protocol}://{host}:{port}{path}'.format(
             protocol=self.config.movies_es.protocol,
             host=self.config.movies_es.host,
             port=self.config.movies_es.port,
             path=self.config.movies_es.alive_url
         )
+        self.bulk_url = '{protocol}://{host}:{port}{path}'.format(
+            protocol=self.config.movies_es.protocol,
+            host=self.config.movies_es.host,
+            port=self.config.movies_es.port,
+            path=self.config.movies_es.url
+        )
+        # Read-only view: accidental header mutation on the hot path
+        # should blow up loudly instead of silently changing requests.
+        self.compress = self.config.movies_es.compress
+        headers = dict(self.config.movies_es.headers)
+        if self.compress:
+            headers['Content-Encoding'] = 'gzip'
+        self.headers = types.MappingProxyType(headers)
+        # Adaptive pause between chunk submissions: grows on 429
+        # rejections, decays to zero while ES keeps up.
+        self.throttle_delay = 0.0
+        # Out-of-order ack bookkeeping for the upload pool.
+        self._ack_lock = threading.Lock()
+        self._acked = {}
+        self._next_ack = 0
 
     @backoff(Exception, logger=logger)
     def server_check(self):
-        response = requests.get(self.alive_url)
+        response = self.session.get(self.alive_url)
         if response.status_code != HTTPStatus.OK:
             raise ConnectionError('ES connection error')
 
     def is_alive(self) -> bool:
         try:
-            response = requests.get(self.alive_url)
+            response = self.session.get(self.alive_url)
             if response.status_code == HTTPStatus.OK:
                 return True
             else:
-                logger.debug(f'ES server NOT alive: {response.status_code}')
+                logger.debug('ES server NOT alive: %s', response.status_code)
                 return False
         except Exception as e:
-            logger.debug(f'Error {e}')
+            logger.debug('Error %s', e)
             return False
 
+    def _post_chunk(self, movies):
+        if self.compress:
+            # Level 1 is enough: NDJSON shrinks ~5x and the point is
+            # network bytes, not compression ratio.
+            movies = gzip.compress(movies, compresslevel=1)
+        while True:
+            response = self.session.post(
+                self.bulk_url, data=movies, headers=self.headers)
+            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                self.throttle_delay = max(self.throttle_delay * 2,
+                                          self.config.movies_es.bulk_timeout)
+                raise ConnectionError('ES rejected bulk chunk: 429')
+            # Other non-2xx answers carry a top-level error object that
+            # filter_path reduces to {} — raise before parsing or the
+            # chunk would be acked as if it landed.
+            response.raise_for_status()
+            # A 200 still carries per-action failures: a full write queue
+            # answers with item-level 429s, which filter_path keeps while
+            # stripping the successful items (and with them the action
+            # positions). Repost the whole chunk — index actions are
+            # idempotent — until no rejections remain.
+            errors = [item
+                      for action in response.json().get('items', [])
+                      for item in action.values() if item.get('error')]
+            rejected = [item for item in errors
+                        if item['error'].get('type')
+                        == 'es_rejected_execution_exception']
+            if rejected:
+                self.throttle_delay = max(self.throttle_delay * 2,
+                                          self.config.movies_es.bulk_timeout)
+                logger.warning(
+                    'ES rejected %d bulk actions, reposting chunk in %.2fs',
+                    len(rejected), self.throttle_delay)
+                time.sleep(self.throttle_delay)
+                continue
+            for failure in errors:
+                logger.error('ES bulk action failed: %s', failure['error'])
+            self.throttle_delay /= 2
+            logger.info('%s', response.content)
+            return
+
+    def _ack_chunk(self, state: State, seq: int, watermark: tuple):
+        """Persist the watermark over contiguously acknowledged chunks.
+
+        Chunks finish out of order on the pool, but the saved keyset
+        position may only move past a chunk once it and every chunk
+        before it were accepted by ES — anything after a gap would be
+        skipped forever on retry. The in-memory copy the extractor
+        reads stays untouched; only the stored snapshot moves.
+        """
+        with self._ack_lock:
+            self._acked[seq] = watermark
+            advanced = None
+            while self._next_ack in self._acked:
+                advanced = self._acked.pop(self._next_ack)
+                self._next_ack += 1
+            if advanced is not None:
+                updated_at, last_id = advanced
+                state.flush_values({'movies_updated_at': updated_at,
+                                    'movies_last_id': last_id})
+
+    def _consume_chunks(self, chunks: queue.Queue, state: State,
+                        failed: threading.Event):
+        """Post chunks from the queue until the None sentinel arrives.
+
+        After the first failure the workers keep draining so the
+        producer never deadlocks on a full queue, but the remaining
+        chunks are never acknowledged: the saved watermark stays at the
+        last contiguous ack, and backoff re-extracts everything after
+        it instead of losing it.
+        """
+        error = None
+        while (item := chunks.get()) is not None:
+            if error is None and not failed.is_set():
+                seq, movies, watermark = item
+                try:
+                    self._post_chunk(movies)
+                except Exception as e:
+                    error = e
+                    failed.set()
+                else:
+                    self._ack_chunk(state, seq, watermark)
+        if error is not None:
+            raise error
+
     @backoff(Exception, logger=logger)
     def upload_movies(self, source: DataTransformer):
-        movies_source = source.transform_movies()
-        url = '{protocol}://{host}:{port}{path}'.format(
-            protocol=self.config.movies_es.protocol,
-            host=self.config.movies_es.host,
-            port=self.config.movies_es.port,
-            path=self.config.movies_es.url
-        )
-        for movies in movies_source:
+        """Upload bulk chunks through a bounded queue and thread pool.
+
+        The calling thread extracts and transforms while worker threads
+        post, so wall time tends to max(extract, upload) instead of the
+        sum. The queue's maxsize keeps backpressure on the extractor
+        generator when ES is the slower side. The watermark is only
+        persisted for acknowledged chunks, so on failure the retry
+        resumes exactly after the last chunk ES accepted.
+        """
+        thread_count = self.config.movies_es.thread_count
+        chunks = queue.Queue(maxsize=self.config.movies_es.queue_size)
+        state = source.extractor.state
+        # Drop any in-memory position a failed attempt ran ahead with.
+        state.reload()
+        failed = threading.Event()
+        self._acked = {}
+        self._next_ack = 0
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            consumers = [executor.submit(self._consume_chunks,
+                                         chunks, state, failed)
+                         for _ in range(thread_count)]
             try:
-                response = requests.post(url, data=movies,
-                                         headers=self.config.movies_es.headers)
-                logger.info(f'{response.content}')
-                time.sleep(self.config.movies_es.bulk_timeout)
-            except Exception as e:
-                raise Exception(f'Exception {e}')
+                for seq, chunk in enumerate(source.transform_movies()):
+                    movies, watermark = chunk
+                    chunks.put((seq, movies, watermark))
+                    if failed.is_set():
+                        break
+                    if self.throttle_delay > 0.001:
+                        time.sleep(self.throttle_delay)
+            finally:
+                for _ in consumers:
+                    chunks.put(None)
+            for consumer in consumers:
+                consumer.result()
 
 
 class EtlManager:
@@ -223,19 +451,35 @@ class EtlManager:
         self.graceful_exit = True
 
     def _execute(self):
-        self.extractor.connect()
-        if not self.extractor.is_connected():
-            return
-        self.uploader.server_check()
-        if not self.uploader.is_alive():
-            return
-        if self.extractor.check_updated_movies():
+        try:
+            self.extractor.connect()
+            if not self.extractor.is_connected():
+                return
+            self.uploader.server_check()
+            if not self.uploader.is_alive():
+                return
             self.uploader.upload_movies(self.transformer)
-        self.extractor.disconnect()
+            self.state.flush()
+            self.extractor.release()
+        except Exception as e:
+            # Next start() iteration reconnects and resumes from the
+            # saved state, so a dropped connection never kills the loop.
+            # Reload so the in-memory watermark a failed run advanced
+            # past unacknowledged chunks cannot be flushed below.
+            logger.error('ETL cycle failed: %s', e)
+            self.state.reload()
+            self.extractor.disconnect()
         if self.graceful_exit:
             logger.info('Terminating app gracefully...')
+            self.state.flush()
             sys.exit()
-        time.sleep(self.config.etl.updates_check_period)
+        try:
+            self.extractor.listen()
+            self.extractor.wait_for_updates(
+                self.config.etl.updates_check_period)
+        except Exception as e:
+            logger.debug('Error %s', e)
+            time.sleep(self.config.etl.updates_check_period)
 
 
 def main():
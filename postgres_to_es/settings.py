@@ -1,7 +1,19 @@
 from pydantic import BaseModel
 
 
-class DSNSettings(BaseModel):
+class FrozenModel(BaseModel):
+    """Settings are read once at startup and never change afterwards.
+
+    Hot-path consumers copy what they need into plain attributes
+    (EsUploader URLs and headers, PgExtractor chunk sizes), so the
+    models themselves can be immutable.
+    """
+
+    class Config:
+        allow_mutation = False
+
+
+class DSNSettings(FrozenModel):
     host: str
     port: int
     dbname: str
@@ -9,12 +21,17 @@ class DSNSettings(BaseModel):
     user: str
 
 
-class PostgresSettings(BaseModel):
+class PostgresSettings(FrozenModel):
     dsn: DSNSettings
-    chunk_size: int
+    # Identifier-only scans are cheap per row, so fetch thousands per
+    # round trip; aggregated movie rows carry JSON arrays and must stay
+    # small to bound memory.
+    id_chunk_size: int
+    row_chunk_size: int
+    pool_size: int
 
 
-class ElasticsearchSettings(BaseModel):
+class ElasticsearchSettings(FrozenModel):
     protocol: str
     host: str
     port: int
@@ -22,20 +39,23 @@ class ElasticsearchSettings(BaseModel):
     alive_url: str
     headers: dict
     bulk_timeout: float
+    thread_count: int
+    queue_size: int
+    compress: bool
 
 
-class StorageSettings(BaseModel):
+class StorageSettings(FrozenModel):
     path: str
 
 
-class EtlSettings(BaseModel):
+class EtlSettings(FrozenModel):
     updates_check_period: int
 
-class LoggingSettings(BaseModel):
+class LoggingSettings(FrozenModel):
     logger_level: str
 
 
-class Config(BaseModel):
+class Config(FrozenModel):
     movies_pg: PostgresSettings
     movies_es: ElasticsearchSettings
     storage: StorageSettings
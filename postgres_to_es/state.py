@@ -1,4 +1,5 @@
 import abc
+import os
 from typing import Optional, Any
 import logging
 import json
@@ -24,8 +25,12 @@ class JsonFileStorage(BaseStorage):
         if self.file_path is None:
             return
 
-        with open(self.file_path, 'w') as f:
+        # Write-then-rename keeps the state file whole even if the
+        # process dies mid-flush.
+        tmp_path = f'{self.file_path}.tmp'
+        with open(tmp_path, 'w') as f:
             json.dump(state, f)
+        os.replace(tmp_path, self.file_path)
 
     def retrieve_state(self) -> dict:
         if self.file_path is None:
@@ -64,8 +69,19 @@ class State:
         """Установить состояние для определённого ключа"""
         self.state[key] = value
 
+    def flush(self) -> None:
+        """Сбросить накопленное состояние в постоянное хранилище"""
         self.storage.save_state(self.state)
 
+    def flush_values(self, updates: dict) -> None:
+        """Сохранить состояние с переопределёнными ключами,
+        не меняя копию в памяти"""
+        self.storage.save_state({**self.state, **updates})
+
+    def reload(self) -> None:
+        """Вернуть состояние к последней сохранённой версии"""
+        self.state = self.retrieve_state()
+
     def get_state(self, key: str) -> Any:
         """Получить состояние по определённому ключу"""
         return self.state.get(key)
@@ -1,5 +1,8 @@
+import io
 import os
+import queue
 import sqlite3
+import threading
 
 import logging
 import time
@@ -13,7 +16,9 @@ from psycopg2.extras import DictCursor
 def get_logger() -> logging.Logger:
     """Get and set logging for debug and measure performance."""
     logger = logging.getLogger(__name__)
-    logger.setLevel('DEBUG')
+    # INFO by default so per-chunk timing lines cost nothing in normal
+    # runs; export LOG_LEVEL=DEBUG to see them.
+    logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
     handler = logging.StreamHandler()
     log_format = '%(asctime)s %(levelname)s -- %(message)s'
     formatter = logging.Formatter(log_format)
@@ -24,81 +29,84 @@ def get_logger() -> logging.Logger:
 
 logger = get_logger()
 
+# Role codes matching the smallint content.movie_people.person_role
+# column: 1 = actor, 2 = director, 3 = writer.
+ROLE_ACTOR = 1
+ROLE_DIRECTOR = 2
+ROLE_WRITER = 3
+
 
 def timed(func):
     """Decorator @timed prints execution time for given function."""
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter_ns()
         result = func(*args, *kwargs)
-        end = time.time()
-        logger.debug('{} ran in {}s'.format(func.__name__,
-                                            round(end - start, 2)))
+        elapsed = time.perf_counter_ns() - start
+        logger.debug('%s ran in %.2fs', func.__name__, elapsed / 1e9)
         return result
 
     return wrapper
 
 
+def copy_buffer(data) -> io.StringIO:
+    """Render rows in COPY text format: tab-separated, \\N for NULL."""
+    buf = io.StringIO()
+    write = buf.write
+    for row in data:
+        write('\t'.join(
+            r'\N' if value is None else
+            str(value).replace('\\', '\\\\')
+                      .replace('\t', '\\t')
+                      .replace('\n', '\\n')
+                      .replace('\r', '\\r')
+            for value in row))
+        write('\n')
+    buf.seek(0)
+    return buf
+
+
 class SQLiteLoader:
     def __init__(self, connection: sqlite3.Connection):
         self.__connection = connection
 
     @timed
-    def load_actors(self, chunk_size=500):
-        curs = self.__connection.cursor()
-        try:
-            query = curs.execute("""SELECT name
-                                      FROM actors
-                                     ORDER BY name
-                                 """)
-            while actors_list := query.fetchmany(chunk_size):
-                yield actors_list
-        except Exception as e:
-            logger.debug(f'Error {e}')
-        finally:
-            curs.close()
-
-    @timed
-    def load_writers(self, chunk_size=500):
-        curs = self.__connection.cursor()
-        try:
-            query = curs.execute("""SELECT name
-                                      FROM writers
-                                     ORDER BY name
-                                 """)
-            while (writers_list := query.fetchmany(chunk_size)):
-                yield writers_list
-        except Exception as e:
-            logger.debug(f'Error {e}')
-        finally:
-            curs.close()
-
-    @timed
-    def load_directors(self, chunk_size=500):
+    def load_people(self, chunk_size=10000):
+        """Stream every distinct person name in a single scan pass.
+
+        Actors, writers and directors used to come from three separate
+        queries; one UNION keeps SQLite on each table exactly once.
+        The director column is split and the (co-director) suffix
+        stripped inside SQLite, so rows arrive one clean name per tuple.
+        """
         curs = self.__connection.cursor()
+        curs.arraysize = chunk_size
         try:
-            query = curs.execute("""SELECT director
-                                      FROM movies
-                                     WHERE NOT (director='N/A')
-                                     ORDER BY director
+            query = curs.execute("""
+                SELECT DISTINCT name FROM (
+                    SELECT name
+                      FROM actors
+                     UNION ALL
+                    SELECT name
+                      FROM writers
+                     UNION ALL
+                    SELECT trim(replace(value, '(co-director)', '')) AS name
+                      FROM movies,
+                           json_each('["'||replace(director,
+                                                   ', ', '","')||'"]')
+                     WHERE NOT (director='N/A')
+                )
                                  """)
-            while (dirty_directors_list := query.fetchmany(chunk_size)):
-                directors_list = []
-                for director_tuple in dirty_directors_list:
-                    for director in director_tuple[0].split(', '):
-                        if director.endswith('(co-director)'):
-                            director = director[:-13]
-                        directors_list.append(tuple([director]))
-                yield directors_list
-        except Exception as e:
-            logger.debug(f'Error {e}')
+            while people_list := query.fetchmany(chunk_size):
+                yield people_list
         finally:
             curs.close()
 
     @timed
-    def load_movies(self, chunk_size=100):
+    def load_movies(self, chunk_size=5000):
         curs = self.__connection.cursor()
+        curs.arraysize = chunk_size
         try:
             query = curs.execute("""SELECT title,
                                       CASE WHEN plot = 'N/A' THEN NULL
@@ -108,66 +116,46 @@ class SQLiteLoader:
                                            ELSE imdb_rating
                                        END AS imdb_rating 
                                       FROM movies
-                                     ORDER BY title
                                  """)
             while movies_list := query.fetchmany(chunk_size):
                 yield movies_list
-        except Exception as e:
-            logger.debug(f'Error {e}')
         finally:
             curs.close()
 
     @timed
     def load_genres(self):
         curs = self.__connection.cursor()
-        result_set = set()
         genre_list = []
         try:
-            query = curs.execute("""SELECT DISTINCT genre
-                                      FROM movies
-                                     ORDER BY genre
+            query = curs.execute("""
+                SELECT DISTINCT trim(value)
+                  FROM movies,
+                       json_each('["'||replace(genre, ', ', '","')||'"]')
                                  """)
-            dirty_genres_list = query.fetchall()
-
-            for genre_tuple in dirty_genres_list:
-                for genre in (genre_tuple[0].split(', ')):
-                    result_set.add(genre)
-
-            for genre in result_set:
-                genre_list.append(tuple([genre]))
-
-        except Exception as e:
-            logger.debug(f'Error {e}')
+            genre_list = query.fetchall()
         finally:
             curs.close()
         return genre_list
 
     @timed
-    def load_movie_genres(self, chunk_size=250):
+    def load_movie_genres(self, chunk_size=10000):
         curs = self.__connection.cursor()
-        movie_genres_list = []
+        curs.arraysize = chunk_size
         try:
-            query = curs.execute("""SELECT title, genre
-                                      FROM movies
-                                     ORDER BY title
+            query = curs.execute("""
+                SELECT title, trim(value)
+                  FROM movies,
+                       json_each('["'||replace(genre, ', ', '","')||'"]')
                                  """)
-            while dirty_movie_genres := query.fetchmany(chunk_size):
-                for movie_genre in dirty_movie_genres:
-                    movies = (movie_genre[0],
-                              tuple(movie_genre[1].split(', '), )
-                              )
-                    for movie in movies[1]:
-                        movie_genres_list.append(tuple([movies[0], movie]))
+            while movie_genres_list := query.fetchmany(chunk_size):
                 yield movie_genres_list
-        except Exception as e:
-            logger.debug(f'Error {e}')
         finally:
             curs.close()
 
     @timed
-    def load_movie_actors(self, chunk_size=500):
+    def load_movie_actors(self, chunk_size=10000):
         curs = self.__connection.cursor()
-        actors_list = []
+        curs.arraysize = chunk_size
         try:
             query = curs.execute("""SELECT a.name, m.title
                                       FROM movie_actors
@@ -176,59 +164,58 @@ class SQLiteLoader:
                                       JOIN actors AS a
                                         ON a.id = movie_actors.actor_id
                                      WHERE NOT (a.name = 'N/A')
-                                     ORDER BY a.name
                                  """)
             while movie_actors := query.fetchmany(chunk_size):
-
-                for movie in movie_actors:
-                    actor = movie + ('actor',)
-                    actors_list.append(actor)
-                yield actors_list
-        except Exception as e:
-            logger.debug(f'Error {e}')
+                yield movie_actors
         finally:
             curs.close()
 
     @timed
-    def load_movie_directors(self, chunk_size=500):
+    def load_movie_directors(self, chunk_size=10000):
         curs = self.__connection.cursor()
-        directors_list = []
+        curs.arraysize = chunk_size
         try:
             query = curs.execute("""SELECT director, title
                                       FROM movies
                                      WHERE NOT (director = 'N/A')
-                                     ORDER BY director
                                  """)
             while (movie_directors := query.fetchmany(chunk_size)):
-                for movie_director in movie_directors:
-                    director = movie_director + ('director',)
-                    directors_list.append(director)
-                yield directors_list
-        except Exception as e:
-            logger.debug(f'Error {e}')
+                yield movie_directors
         finally:
             curs.close()
 
     @timed
-    def load_movie_writers(self, chunk_size=500):
+    def load_movie_writers(self, chunk_size=10000):
         curs = self.__connection.cursor()
-        writers_list = []
+        curs.arraysize = chunk_size
         try:
+            # Explode the writers JSON column into a keyed temp map
+            # once, then equijoin: the old LIKE '%'||w.id||'%' predicate
+            # forced a movies×writers cross scan.
+            curs.execute("""DROP TABLE IF EXISTS temp.movie_writers_map""")
+            curs.execute("""
+                CREATE TEMP TABLE movie_writers_map AS
+                    SELECT id AS movie_id, writer AS writer_id
+                      FROM movies
+                     WHERE writer != ''
+                     UNION
+                    SELECT movies.id, json_extract(value, '$.id')
+                      FROM movies, json_each(writers)
+                     WHERE writers != ''
+                                 """)
+            curs.execute("""CREATE INDEX temp.mw_map_writer_idx
+                                ON movie_writers_map(writer_id)
+                         """)
             query = curs.execute("""SELECT w.name, m.title
-                                      FROM movies AS m
+                                      FROM movie_writers_map AS mw
                                       JOIN writers AS w
-                                        ON m.writer = w.id
-                                           OR m.writers LIKE '%'||w.id||'%'
+                                        ON w.id = mw.writer_id
+                                      JOIN movies AS m
+                                        ON m.id = mw.movie_id
                                      WHERE NOT (w.name = 'N/A')
-                                     ORDER BY w.name
                                  """)
             while movie_writers := query.fetchmany(chunk_size):
-                for movie_writer in movie_writers:
-                    writer = movie_writer + ('writer',)
-                    writers_list.append(writer)
-                yield writers_list
-        except Exception as e:
-            logger.debug(f'Error {e}')
+                yield movie_writers
         finally:
             curs.close()
 
@@ -236,139 +223,214 @@ class SQLiteLoader:
 class PostgresSaver:
     def __init__(self, pg_conn: _connection):
         self.__connection = pg_conn
+        # One cursor serves every statement the saver runs: opening and
+        # closing one per call is pure protocol overhead.
+        self.__cursor = pg_conn.cursor()
+
+    def close(self):
+        self.__cursor.close()
+
+    @timed
+    def begin_bulk_load(self):
+        """Open the single load transaction with bulk-friendly settings.
+
+        The unique constraints backing ON CONFLICT stay in place; only
+        secondary indexes nobody reads during the load are dropped and
+        rebuilt afterwards. The title/name lookup indexes survive since
+        the staging JOIN inserts depend on them.
+        """
+        curs = self.__cursor
+        curs.execute("""SET LOCAL synchronous_commit = OFF""")
+        curs.execute("""SET LOCAL maintenance_work_mem = '512MB'""")
+        curs.execute("""
+            DROP INDEX IF EXISTS content.people_birthday_month_day_idx;
+            DROP INDEX IF EXISTS content.movies_updated_at_movie_id_idx;
+            DROP INDEX IF EXISTS content.movie_people_actor_idx;
+            DROP INDEX IF EXISTS content.movie_people_director_idx;
+            DROP INDEX IF EXISTS content.movie_people_writer_idx;
+        """)
+        # Staging tables are created once and truncated between
+        # chunks; no UNIQUE on them since COPY cannot skip
+        # conflicts and the flush inserts dedupe anyway.
+        curs.execute("""
+            CREATE UNLOGGED TABLE IF NOT EXISTS content.people_tmp (
+                full_name    text
+            );
+            CREATE UNLOGGED TABLE IF NOT EXISTS content.genres_tmp (
+                genre_name    text
+            );
+            CREATE UNLOGGED TABLE IF NOT EXISTS content.movies_tmp (
+                movie_title    text,
+                movie_desc     text,
+                movie_rating   real
+            );
+            CREATE UNLOGGED TABLE IF NOT EXISTS content.mg_tmp (
+                movie_title    text,
+                genre_name     text
+            );
+            CREATE UNLOGGED TABLE IF NOT EXISTS content.mp_tmp (
+                person_name    text,
+                movie_title    text
+            );
+        """)
+        # psycopg2 has no cursor.prepare, so the per-chunk flush
+        # statements are prepared server-side and EXECUTEd by name:
+        # parse and plan happen once per session, not per chunk. The
+        # role code is baked into one flush statement per role, so it
+        # never travels with the rows.
+        curs.execute(f"""
+            PREPARE flush_people AS
+                INSERT INTO content.people (full_name)
+                SELECT full_name
+                  FROM content.people_tmp
+                    ON CONFLICT DO NOTHING;
+            PREPARE flush_genres AS
+                INSERT INTO content.genres (genre_name)
+                SELECT genre_name
+                  FROM content.genres_tmp
+                    ON CONFLICT DO NOTHING;
+            PREPARE flush_movies AS
+                INSERT INTO content.movies (movie_title,
+                                            movie_desc,
+                                            movie_rating)
+                SELECT movie_title, movie_desc, movie_rating
+                  FROM content.movies_tmp
+                    ON CONFLICT DO NOTHING;
+            PREPARE flush_movie_genres AS
+                INSERT INTO content.movie_genres (movie_id, genre_id)
+                SELECT m.movie_id, g.genre_id
+                  FROM content.mg_tmp AS t
+                  JOIN content.genres AS g
+                    ON g.genre_name = t.genre_name
+                  JOIN content.movies AS m
+                    ON m.movie_title = t.movie_title
+                    ON CONFLICT DO NOTHING;
+            PREPARE flush_movie_actors AS
+                INSERT INTO content.movie_people (movie_id,
+                                                  person_id,
+                                                  person_role)
+                SELECT m.movie_id, p.person_id, {ROLE_ACTOR}
+                  FROM content.mp_tmp AS t
+                  JOIN content.people AS p
+                    ON p.full_name = t.person_name
+                  JOIN content.movies AS m
+                    ON m.movie_title = t.movie_title
+                    ON CONFLICT DO NOTHING;
+            PREPARE flush_movie_directors AS
+                INSERT INTO content.movie_people (movie_id,
+                                                  person_id,
+                                                  person_role)
+                SELECT m.movie_id, p.person_id, {ROLE_DIRECTOR}
+                  FROM content.mp_tmp AS t
+                  JOIN content.people AS p
+                    ON p.full_name = t.person_name
+                  JOIN content.movies AS m
+                    ON m.movie_title = t.movie_title
+                    ON CONFLICT DO NOTHING;
+            PREPARE flush_movie_writers AS
+                INSERT INTO content.movie_people (movie_id,
+                                                  person_id,
+                                                  person_role)
+                SELECT m.movie_id, p.person_id, {ROLE_WRITER}
+                  FROM content.mp_tmp AS t
+                  JOIN content.people AS p
+                    ON p.full_name = t.person_name
+                  JOIN content.movies AS m
+                    ON m.movie_title = t.movie_title
+                    ON CONFLICT DO NOTHING;
+        """)
+
+    @timed
+    def finish_bulk_load(self):
+        """Rebuild the dropped indexes and commit the load as one unit."""
+        curs = self.__cursor
+        curs.execute("""
+                CREATE INDEX IF NOT EXISTS people_birthday_month_day_idx
+                          ON content.people
+                             ((EXTRACT(month FROM birthday)),
+                              (EXTRACT(day FROM birthday)));
+                CREATE INDEX IF NOT EXISTS movies_updated_at_movie_id_idx
+                          ON content.movies(updated_at, movie_id);
+                CREATE INDEX IF NOT EXISTS movie_people_actor_idx
+                          ON content.movie_people(movie_id)
+                       WHERE person_role = 1;
+                CREATE INDEX IF NOT EXISTS movie_people_director_idx
+                          ON content.movie_people(movie_id)
+                       WHERE person_role = 2;
+                CREATE INDEX IF NOT EXISTS movie_people_writer_idx
+                          ON content.movie_people(movie_id)
+                       WHERE person_role = 3;
+            """)
+        curs.execute("""
+                DROP TABLE IF EXISTS content.people_tmp,
+                                     content.genres_tmp,
+                                     content.movies_tmp,
+                                     content.mg_tmp,
+                                     content.mp_tmp;
+                DEALLOCATE ALL;
+            """)
+        self.__connection.commit()
+
+    def rollback(self):
+        self.__connection.rollback()
 
     @timed
     def truncate_tables(self):
-        curs = self.__connection.cursor()
-        try:
-            curs.execute(f"""TRUNCATE content.people CASCADE""")
-            curs.execute(f"""TRUNCATE content.genres CASCADE""")
-            curs.execute(f"""TRUNCATE content.movies CASCADE""")
-            curs.execute(f"""TRUNCATE content.movie_genres CASCADE""")
-            curs.execute(f"""TRUNCATE content.movie_people CASCADE""")
-        except Exception as e:
-            logger.debug(f'Error {e}')
-        finally:
-            curs.close()
+        curs = self.__cursor
+        curs.execute(f"""TRUNCATE content.people CASCADE""")
+        curs.execute(f"""TRUNCATE content.genres CASCADE""")
+        curs.execute(f"""TRUNCATE content.movies CASCADE""")
+        curs.execute(f"""TRUNCATE content.movie_genres CASCADE""")
+        curs.execute(f"""TRUNCATE content.movie_people CASCADE""")
 
     @timed
     def save_people(self, data):
-        curs = self.__connection.cursor()
-        args = ','.join(curs.mogrify("(%s)",
-                                     item).decode() for item in data)
-        try:
-            curs.execute(f"""INSERT INTO content.people (full_name)
-                             VALUES {args}
-                                 ON CONFLICT DO NOTHING
-                          """)
-        except Exception as e:
-            logger.debug(f'Error {e}')
-        finally:
-            curs.close()
+        curs = self.__cursor
+        curs.copy_expert("""COPY content.people_tmp (full_name)
+                            FROM STDIN""", copy_buffer(data))
+        curs.execute("""EXECUTE flush_people""")
+        curs.execute("""TRUNCATE content.people_tmp""")
 
     @timed
     def save_genres(self, data):
-        curs = self.__connection.cursor()
-        args = ','.join(curs.mogrify("(%s)",
-                                     item).decode() for item in data)
-        try:
-            curs.execute(f"""INSERT INTO content.genres (genre_name)
-                             VALUES {args}
-                                 ON CONFLICT DO NOTHING                           
-                          """)
-        except Exception as e:
-            logger.debug(f'Error {e}')
-        finally:
-            curs.close()
+        curs = self.__cursor
+        curs.copy_expert("""COPY content.genres_tmp (genre_name)
+                            FROM STDIN""", copy_buffer(data))
+        curs.execute("""EXECUTE flush_genres""")
+        curs.execute("""TRUNCATE content.genres_tmp""")
 
     @timed
     def save_movies(self, data):
-        curs = self.__connection.cursor()
-        args = ','.join(curs.mogrify("(%s, %s, %s)",
-                                     item).decode() for item in data)
-        try:
-            curs.execute(f"""INSERT INTO content.movies (movie_title,
-                                                         movie_desc,
-                                                         movie_rating)
-                             VALUES {args}
-                                 ON CONFLICT DO NOTHING
-                          """)
-        except Exception as e:
-            logger.debug(f'Error {e}')
-        finally:
-            curs.close()
+        curs = self.__cursor
+        curs.copy_expert("""COPY content.movies_tmp (movie_title,
+                                                     movie_desc,
+                                                     movie_rating)
+                            FROM STDIN""", copy_buffer(data))
+        curs.execute("""EXECUTE flush_movies""")
+        curs.execute("""TRUNCATE content.movies_tmp""")
 
     @timed
     def save_movie_genres(self, data):
-        curs = self.__connection.cursor()
-        args = ','.join(curs.mogrify("(%s, %s)",
-                                     item).decode() for item in data)
-        try:
-            curs.execute(f"""CREATE TABLE IF NOT EXISTS content.mg_tmp (
-                                 movie_title    text,
-                                 genre_name     text,
-                                 UNIQUE (movie_title, genre_name)
-                             )
-                          """)
-            curs.execute(f"""INSERT INTO content.mg_tmp
-                             VALUES {args}
-                                 ON CONFLICT DO NOTHING
-                          """)
-            curs.execute(f"""INSERT INTO content.movie_genres(movie_id,
-                                                              genre_id)
-                             SELECT m.movie_id, g.genre_id
-                               FROM content.mg_tmp AS t
-                               JOIN content.genres AS g
-                                 ON g.genre_name = t.genre_name
-                               JOIN content.movies AS m
-                                 ON m.movie_title = t.movie_title
-                              ORDER BY m.movie_title
-                                 ON CONFLICT DO NOTHING
-                          """)
-            curs.execute(f"""DROP TABLE content.mg_tmp""")
-        except Exception as e:
-            logger.debug(f'Error {e}')
-        finally:
-            curs.close()
+        curs = self.__cursor
+        curs.copy_expert("""COPY content.mg_tmp (movie_title,
+                                                 genre_name)
+                            FROM STDIN""", copy_buffer(data))
+        curs.execute("""EXECUTE flush_movie_genres""")
+        curs.execute("""TRUNCATE content.mg_tmp""")
+
+    # Which prepared flush lands a staged chunk for each role code.
+    FLUSH_MOVIE_PEOPLE = {ROLE_ACTOR: 'flush_movie_actors',
+                          ROLE_DIRECTOR: 'flush_movie_directors',
+                          ROLE_WRITER: 'flush_movie_writers'}
 
     @timed
-    def save_movie_people(self, data):
-        curs = self.__connection.cursor()
-        args = ','.join(curs.mogrify("(%s, %s, %s)",
-                                     item).decode() for item in data)
-        try:
-            curs.execute(f"""CREATE TABLE IF NOT EXISTS content.mp_tmp (
-                                 person_name    text,
-                                 movie_title    text,
-                                 person_role    content.person_role,
-                                 UNIQUE (movie_title,
-                                         person_name,
-                                         person_role)
-                             )
-                          """)
-            curs.execute(f"""INSERT INTO content.mp_tmp
-                             VALUES {args}
-                                 ON CONFLICT DO NOTHING
-                          """)
-            curs.execute(f"""INSERT INTO 
-                                    content.movie_people(
-                                        movie_id,                      
-                                        person_id,
-                                        person_role)
-                             SELECT m.movie_id, p.person_id, t.person_role
-                               FROM content.mp_tmp AS t
-                               JOIN content.people AS p
-                                 ON p.full_name = t.person_name
-                               JOIN content.movies AS m
-                                 ON m.movie_title = t.movie_title
-                              ORDER BY m.movie_title
-                                 ON CONFLICT DO NOTHING
-                          """)
-            curs.execute(f"""DROP TABLE content.mp_tmp""")
-        except Exception as e:
-            logger.debug(f'Error {e}')
-        finally:
-            curs.close()
+    def save_movie_people(self, data, role):
+        curs = self.__cursor
+        curs.copy_expert("""COPY content.mp_tmp (person_name,
+                                                 movie_title)
+                            FROM STDIN""", copy_buffer(data))
+        curs.execute(f"""EXECUTE {self.FLUSH_MOVIE_PEOPLE[role]}""")
+        curs.execute("""TRUNCATE content.mp_tmp""")
 
 
 class DatabaseMigrator:
@@ -385,12 +447,8 @@ class DatabaseMigrator:
             self.__saver.truncate_tables()
 
     def __save_people(self):
-        for actor in (actors := self.__loader.load_actors()):
-            self.__saver.save_people(actor)
-        for director in (directors := self.__loader.load_directors()):
-            self.__saver.save_people(director)
-        for writer in (writers := self.__loader.load_writers()):
-            self.__saver.save_people(writer)
+        for people in (people_chunks := self.__loader.load_people()):
+            self.__saver.save_people(people)
 
     def __save_genres(self):
         self.__saver.save_genres(genres := self.__loader.load_genres())
@@ -404,23 +462,55 @@ class DatabaseMigrator:
             self.__saver.save_movie_genres(movie_genre)
 
     def __save_movie_people(self):
-        people = [directors := self.__loader.load_movie_directors(),
-                  actors := self.__loader.load_movie_actors(),
-                  writers := self.__loader.load_movie_writers()]
-        for person_group in people:
-            for person in person_group:
-                self.__saver.save_movie_people(person)
+        # A producer thread walks the three role loaders while this
+        # thread runs the Postgres side, so SQLite reads overlap COPY
+        # round trips. Everything still lands in the one load
+        # transaction on the single saver connection; the queue bound
+        # keeps backpressure on the extraction.
+        chunks = queue.Queue(maxsize=4)
+        errors = []
+
+        def produce():
+            try:
+                for role, load in (
+                        (ROLE_DIRECTOR, self.__loader.load_movie_directors),
+                        (ROLE_ACTOR, self.__loader.load_movie_actors),
+                        (ROLE_WRITER, self.__loader.load_movie_writers)):
+                    for person_chunk in load():
+                        chunks.put((role, person_chunk))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                chunks.put(None)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        while (item := chunks.get()) is not None:
+            role, person_chunk = item
+            self.__saver.save_movie_people(person_chunk, role)
+        producer.join()
+        if errors:
+            raise errors[0]
 
     def migrate(self):
         try:
+            self.__saver.begin_bulk_load()
             self.__truncate_tables()
             self.__save_people()
             self.__save_genres()
             self.__save_movies()
             self.__save_movie_genres()
             self.__save_movie_people()
-        except Exception as e:
-            logger.debug(f'Migration error {e}')
+            self.__saver.finish_bulk_load()
+        except Exception:
+            # Roll back so the connection is usable again, then let the
+            # error surface instead of silently going through the
+            # motions on an aborted transaction.
+            logger.exception('Migration failed')
+            self.__saver.rollback()
+            raise
+        finally:
+            self.__saver.close()
 
 
 @timed
@@ -440,6 +530,17 @@ if __name__ == '__main__':
            'port': os.environ.get('DB_PORT', '5432'),
            }
 
-    with sqlite3.connect('db.sqlite') as sqlite_conn, \
+    # check_same_thread off: the movie_people loaders run on a producer
+    # thread; the connection is still only used by one thread at a time.
+    with sqlite3.connect('db.sqlite', check_same_thread=False) as sqlite_conn, \
             psycopg2.connect(**dsl, cursor_factory=DictCursor) as pg_conn:
+        # Bulk-read tuning: big page cache and mmap keep the repeated
+        # movies scans in RAM instead of per-page read() syscalls.
+        # query_only stays off because load_movie_writers builds a temp
+        # table, and journal_mode is left alone to avoid rewriting the
+        # source file header.
+        sqlite_conn.execute('PRAGMA synchronous=OFF')
+        sqlite_conn.execute('PRAGMA temp_store=MEMORY')
+        sqlite_conn.execute('PRAGMA cache_size=-262144')
+        sqlite_conn.execute('PRAGMA mmap_size=1073741824')
         main(sqlite_conn, pg_conn)